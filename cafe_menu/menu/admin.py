@@ -62,6 +62,7 @@ class MenuItemAdmin(admin.ModelAdmin):
         "rating",
         "updated_at",
     )
+    list_select_related = ("category",)
     list_filter = ("category", "currency", "is_signature", "is_available")
     search_fields = ("name_en", "name_fa", "description_en", "description_fa")
     autocomplete_fields = ("category",)
@@ -112,6 +113,29 @@ class MenuItemAdmin(admin.ModelAdmin):
         ),
     )
 
+    changelist_only_fields = (
+        "name_en",
+        "name_fa",
+        "category__title_en",
+        "category__title_fa",
+        "price",
+        "currency",
+        "is_signature",
+        "is_available",
+        "rating",
+        "updated_at",
+    )
+
+    def get_queryset(self, request):
+        # Also covers the autocomplete and change views, not just the changelist.
+        queryset = super().get_queryset(request).select_related("category")
+        match = request.resolver_match
+        changelist_url_name = f"{self.opts.app_label}_{self.opts.model_name}_changelist"
+        if match is not None and match.url_name == changelist_url_name:
+            # Leave descriptions and images off the wire for list pages.
+            queryset = queryset.only(*self.changelist_only_fields)
+        return queryset
+
 
 @admin.register(SiteSetting)
 class SiteSettingAdmin(admin.ModelAdmin):
@@ -139,6 +163,11 @@ class SiteSettingAdmin(admin.ModelAdmin):
     )
     list_display = ("site_name", "contact_email", "opening_hours")
 
+    def delete_queryset(self, request, queryset):
+        # Go through SiteSetting.delete() so the caches are invalidated.
+        for setting in queryset:
+            setting.delete()
+
     def has_add_permission(self, request):
         if SiteSetting.objects.exists():
             return False
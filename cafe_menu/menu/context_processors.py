@@ -1,49 +1,102 @@
 """Context processors for the menu app."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 from django.conf import settings
 from django.core.cache import cache
+from django.utils import translation
 
-from .models import SITE_SETTINGS_CACHE_KEY, SiteSetting
+from .models import SITE_SETTINGS_CACHE_KEY, SiteSetting, get_menu_revision
 
+_LANG_LIST = tuple(code for code, _ in settings.LANGUAGES)
+_LANG_CODES = frozenset(_LANG_LIST)
+# Sections (after any language prefix) whose templates never read the site settings.
+_UNTHEMED_PREFIXES = ("admin/", "i18n/")
+_ROOT_LANG_URLS = MappingProxyType({code: f"/{code}/" for code in _LANG_LIST})
 
-def _language_paths(request):
-    """Build localized URLs for the current path."""
 
-    path = request.path_info or "/"
+@lru_cache(maxsize=2048)
+def _language_paths_for(path: str) -> Mapping[str, str]:
+    """Build localized URLs for ``path``.
+
+    Results are shared between requests, so a read-only mapping is returned.
+    """
+
     trimmed = path.lstrip("/")
     parts = trimmed.split("/", 1) if trimmed else []
-    language_codes = {code for code, _ in settings.LANGUAGES}
 
-    if parts and parts[0] in language_codes:
+    if parts and parts[0] in _LANG_CODES:
         remainder = parts[1] if len(parts) > 1 else ""
     else:
         remainder = trimmed
 
     remainder = remainder.strip("/")
+    if not remainder:
+        return _ROOT_LANG_URLS
 
-    urls = {}
-    for code, _ in settings.LANGUAGES:
-        suffix = f"{remainder}/" if remainder else ""
-        urls[code] = f"/{code}/" + suffix
-    return urls
+    return MappingProxyType({code: f"/{code}/{remainder}/" for code in _LANG_LIST})
 
 
-def global_settings(request):
-    """Expose the singleton site settings instance to every template."""
+def _is_unthemed(path: str) -> bool:
+    trimmed = path.lstrip("/")
+    head, _, rest = trimmed.partition("/")
+    if head in _LANG_CODES:
+        trimmed = rest
+    return trimmed.startswith(_UNTHEMED_PREFIXES)
+
 
-    settings_instance = cache.get(SITE_SETTINGS_CACHE_KEY)
+def _load_site_settings():
+    settings_instance = SiteSetting.objects.first()
     if settings_instance is None:
-        settings_instance = SiteSetting.objects.first()
-        if settings_instance is None:
-            # Provide a lightweight placeholder to keep templates from breaking.
-            settings_instance = SiteSetting(site_name_en="Cafe Menu")
-        cache.set(SITE_SETTINGS_CACHE_KEY, settings_instance, 60 * 5)
+        # Provide a lightweight placeholder to keep templates from breaking.
+        settings_instance = SiteSetting(site_name_en="Cafe Menu")
+    return settings_instance
+
+
+def _site_settings_payload():
+    """Flatten the settings for the active language into a small dict."""
+
+    instance = _load_site_settings()
+    return {
+        "site_name": instance.site_name,
+        "hero_headline": instance.hero_headline,
+        "hero_subtitle": instance.hero_subtitle,
+        "address": instance.address,
+        "footer_text": instance.footer_text,
+        "seo_description": instance.seo_description,
+        "contact_email": instance.contact_email,
+        "contact_phone": instance.contact_phone,
+        "contact_whatsapp": instance.contact_whatsapp,
+        "opening_hours": instance.opening_hours,
+        "footer_links": instance.footer_links,
+        "social_links": instance.social_links,
+        "site_logo_url": instance.site_logo.url if instance.site_logo else "",
+        "site_favicon_url": instance.site_favicon.url if instance.site_favicon else "",
+    }
+
+
+def global_settings(request):
+    """Expose the localized site settings to every template."""
+
+    path = request.path_info or "/"
+    if _is_unthemed(path):
+        return {}
+
+    lang = (translation.get_language() or "en").split("-")[0]
+    # Read the revision first: settings saves clear the payload before bumping it.
+    revision = get_menu_revision()
+    site_settings = cache.get_or_set(
+        f"{SITE_SETTINGS_CACHE_KEY}:{lang}", _site_settings_payload, 60 * 60
+    )
 
-    language_urls = _language_paths(request)
+    language_urls = _language_paths_for(path)
 
     return {
-        "site_settings": settings_instance,
+        "site_settings": site_settings,
         "language_urls": language_urls,
+        "menu_revision": revision,
     }
 
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0002_remove_sitesetting_site_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='menucategory',
+            index=models.Index(fields=['is_active', 'display_order'], name='menu_menuca_is_acti_8f7f85_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='menuitem',
+            index=models.Index(fields=['category', 'is_available', 'is_signature'], name='menu_menuit_categor_b507e3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='menuitem',
+            index=models.Index(fields=['is_signature', 'is_available'], name='menu_menuit_is_sign_b48ed0_idx'),
+        ),
+    ]
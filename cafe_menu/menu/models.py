@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import time
 from decimal import Decimal
+from types import MappingProxyType
 
+from django.conf import settings
 from django.core.cache import cache
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone, translation
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
@@ -21,17 +27,53 @@ class TimeStampedModel(models.Model):
         ordering = ("-created_at",)
 
 
+# (field_prefix, lang) -> (preferred attribute, fallback attribute)
+_FIELD_NAME_CACHE: dict[tuple[str, str], tuple[str, str]] = {}
+
+
 class TranslatableFieldsMixin:
     """Mixin that returns the field value that matches the current language."""
 
     def translate(self, field_prefix: str) -> str:
         lang = (translation.get_language() or "en").split("-")[0]
-        preferred_field = f"{field_prefix}_{lang}"
-        fallback_field = f"{field_prefix}_en"
+        names = _FIELD_NAME_CACHE.get((field_prefix, lang))
+        if names is None:
+            names = _FIELD_NAME_CACHE.setdefault(
+                (field_prefix, lang), (f"{field_prefix}_{lang}", f"{field_prefix}_en")
+            )
+        preferred_field, fallback_field = names
         return getattr(self, preferred_field, None) or getattr(self, fallback_field, "")
 
 
 SITE_SETTINGS_CACHE_KEY = "menu.site_settings"
+MENU_REVISION_CACHE_KEY = "menu.revision"
+
+
+def site_settings_cache_keys() -> list[str]:
+    """Every cache key that may hold site settings, one per language."""
+
+    return [SITE_SETTINGS_CACHE_KEY] + [
+        f"{SITE_SETTINGS_CACHE_KEY}:{code}" for code, _ in settings.LANGUAGES
+    ]
+
+
+def get_menu_revision() -> int:
+    """Return a token that changes whenever menu content is edited."""
+
+    return cache.get_or_set(MENU_REVISION_CACHE_KEY, time.time_ns, None)
+
+
+def bump_menu_revision() -> None:
+    cache.set(MENU_REVISION_CACHE_KEY, time.time_ns(), None)
+
+
+class MenuQuerySet(models.QuerySet):
+    """QuerySet whose bulk updates also invalidate cached menu markup."""
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        bump_menu_revision()
+        return rows
 
 
 class SiteSetting(TranslatableFieldsMixin, models.Model):
@@ -94,11 +136,13 @@ class SiteSetting(TranslatableFieldsMixin, models.Model):
 
     def save(self, *args, **kwargs) -> None:
         super().save(*args, **kwargs)
-        cache.delete(SITE_SETTINGS_CACHE_KEY)
+        cache.delete_many(site_settings_cache_keys())
+        bump_menu_revision()
 
     def delete(self, using=None, keep_parents=False):
         response = super().delete(using=using, keep_parents=keep_parents)
-        cache.delete(SITE_SETTINGS_CACHE_KEY)
+        cache.delete_many(site_settings_cache_keys())
+        bump_menu_revision()
         return response
 
 
@@ -113,8 +157,11 @@ class MenuCategory(TimeStampedModel, TranslatableFieldsMixin):
     display_order = models.PositiveIntegerField(_("display order"), default=0)
     is_active = models.BooleanField(_("active"), default=True)
 
+    objects = MenuQuerySet.as_manager()
+
     class Meta(TimeStampedModel.Meta):
         ordering = ("display_order",)
+        indexes = [models.Index(fields=["is_active", "display_order"])]
         verbose_name = _("category")
         verbose_name_plural = _("categories")
 
@@ -137,6 +184,12 @@ class MenuItem(TimeStampedModel, TranslatableFieldsMixin):
         ("IRR", _("Iranian Rial")),
         ("USD", _("US Dollar")),
     ]
+    _CURRENCY_SYMBOLS = MappingProxyType(
+        {
+            "USD": "$",
+            "IRR": "﷼",
+        }
+    )
 
     category = models.ForeignKey(MenuCategory, related_name="items", on_delete=models.CASCADE)
     name_en = models.CharField(_("name (EN)"), max_length=140)
@@ -171,8 +224,14 @@ class MenuItem(TimeStampedModel, TranslatableFieldsMixin):
         help_text=_("Optional public rating displayed on the card"),
     )
 
+    objects = MenuQuerySet.as_manager()
+
     class Meta(TimeStampedModel.Meta):
         ordering = ("category", "name_en")
+        indexes = [
+            models.Index(fields=["category", "is_available", "is_signature"]),
+            models.Index(fields=["is_signature", "is_available"]),
+        ]
         verbose_name = _("menu item")
         verbose_name_plural = _("menu items")
 
@@ -189,21 +248,25 @@ class MenuItem(TimeStampedModel, TranslatableFieldsMixin):
         return self.translate("highlight_badge")
 
     def currency_symbol(self) -> str:
-        symbols = {
-            "USD": "$",
-            "IRR": "﷼",
-        }
-        return symbols.get(self.currency, self.currency)
+        return self._CURRENCY_SYMBOLS.get(self.currency, self.currency)
 
+    @cached_property
     def formatted_price(self) -> str:
-        return f"{self.currency_symbol()}{format(self.price, '0.2f')}"
+        return f"{self.currency_symbol()}{self.price:0.2f}"
 
     def __str__(self) -> str:
         return self.name
 
     def save(self, *args, **kwargs) -> None:
-        if not self.slug:
+        update_fields = kwargs.get("update_fields")
+        # A partial save that excludes slug would discard the generated value.
+        if not self.slug and self.name_en and (update_fields is None or "slug" in update_fields):
             self.slug = slugify(self.name_en)
         super().save(*args, **kwargs)
 
 
+@receiver((post_save, post_delete), sender=MenuCategory, dispatch_uid="menu.revision.menucategory")
+@receiver((post_save, post_delete), sender=MenuItem, dispatch_uid="menu.revision.menuitem")
+def _bump_menu_revision_on_change(**kwargs) -> None:
+    # Signals also fire for admin bulk deletes and cascades, which skip delete().
+    bump_menu_revision()
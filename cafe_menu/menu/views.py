@@ -1,53 +1,69 @@
 """Public views for the cafe menu."""
 from __future__ import annotations
 
-from itertools import islice
-
 from django.conf import settings
-from django.db.models import Prefetch
+from django.db.models import F, Prefetch, TextField, Value
+from django.db.models.functions import Coalesce, NullIf
+from django.utils import translation
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.views.decorators.vary import vary_on_cookie
+from django.views.decorators.vary import vary_on_headers
 from django.views.generic import TemplateView
 
 from .models import MenuCategory, MenuItem
 
+_LANG_CODES = frozenset(code for code, _ in settings.LANGUAGES)
+_DEFAULT_LANG = settings.LANGUAGE_CODE.split("-")[0]
+_LANGUAGE_COOKIE_NAME = settings.LANGUAGE_COOKIE_NAME
+
+
+def _localized(field_prefix: str, lang: str):
+    """Database-side equivalent of ``TranslatableFieldsMixin.translate``."""
+
+    preferred = NullIf(F(f"{field_prefix}_{lang}"), Value(""), output_field=TextField())
+    return Coalesce(preferred, F(f"{field_prefix}_en"), output_field=TextField())
+
 
-@method_decorator(cache_page(60 * 5), name="dispatch")
-@method_decorator(vary_on_cookie, name="dispatch")
+def _localized_annotations(lang: str, *field_prefixes: str) -> dict:
+    return {f"{prefix}_localized": _localized(prefix, lang) for prefix in field_prefixes}
+
+
+@method_decorator(vary_on_headers("Accept-Language"), name="dispatch")
 class HomePageView(TemplateView):
+    """Landing page; the menu markup is cached per language and menu revision."""
+
     template_name = "menu/home.html"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        categories = list(
+        lang = (translation.get_language() or "en").split("-")[0]
+        if lang not in _LANG_CODES:
+            lang = "en"
+        items = MenuItem.objects.annotate(
+            **_localized_annotations(lang, "name", "description", "highlight_badge")
+        )
+        # Querysets stay lazy so a template fragment cache hit skips the database.
+        context["categories"] = (
             MenuCategory.objects.filter(is_active=True)
+            .annotate(**_localized_annotations(lang, "title", "description"))
             .prefetch_related(
                 Prefetch(
                     "items",
-                    queryset=MenuItem.objects.filter(is_available=True).order_by("-is_signature", "name_en"),
+                    queryset=items.filter(is_available=True).order_by("-is_signature", "name_en"),
+                    to_attr="menu_items",
                 )
             )
             .order_by("display_order")
         )
-        context["categories"] = categories
-        context["signature_items"] = list(
-            islice(
-                (
-                    item
-                    for category in categories
-                    for item in category.items.all()
-                    if item.is_signature
-                ),
-                4,
-            )
+        context["signature_items"] = (
+            items.filter(is_signature=True, is_available=True, category__is_active=True)
+            .select_related("category")
+            .order_by("category__display_order", "name_en")[:4]
         )
-        language_cookie = self.request.COOKIES.get(settings.LANGUAGE_COOKIE_NAME)
+        language_cookie = self.request.COOKIES.get(_LANGUAGE_COOKIE_NAME)
         current_language = getattr(self.request, "LANGUAGE_CODE", None)
-        default_lang = settings.LANGUAGE_CODE.split("-")[0]
         context["language_selected"] = bool(
             language_cookie
-            or (current_language and current_language.split("-")[0] != default_lang)
+            or (current_language and current_language.split("-")[0] != _DEFAULT_LANG)
         )
         return context
 